@@ -116,6 +116,10 @@ def fromHex(hexStr):
 def toSignedByteString(value):
     # type: (int) -> bytearray
     """Convert an integer into bytes."""
+    if not isP2:
+        # Minimal two's complement: leave room for the sign bit
+        length = ((value if value >= 0 else ~value).bit_length() + 8) // 8
+        return bytearray(value.to_bytes(length, 'big', signed=True))
     result = bytearray()
     if value == 0 or value == -1:
         result.append(value & 0xFF)
@@ -135,6 +139,8 @@ def toSignedByteString(value):
 def fromSignedByteString(data):
     # type: (bytearray) -> int
     """Convert bytes into a signed integer."""
+    if not isP2:
+        return int.from_bytes(data, 'big', signed=True)
     if data:
         is_neg = (data[0] & 0x80) >> 7
     else:
@@ -151,6 +157,9 @@ def fromSignedByteString(data):
 def toByteString(bigInt):
     # type: (int) -> bytearray
     """Convert an integer into bytes."""
+    if not isP2 and bigInt >= 0:
+        length = max((bigInt.bit_length() + 7) // 8, 1)
+        return bytearray(bigInt.to_bytes(length, 'big'))
     result = bytearray()
     if bigInt == -1 or bigInt == 0:
         result.append(bigInt & 0xFF)
@@ -165,6 +174,8 @@ def toByteString(bigInt):
 def fromByteString(data):
     # type: (bytearray) -> int
     """Convert bytes into an integer."""
+    if not isP2:
+        return int.from_bytes(data, 'big')
     result = 0
     shiftCount = 0
     for b in reversed(data):
@@ -10,11 +10,11 @@ Exported Classes:
 Cursor -- Class for representing a database cursor.
 """
 
-from collections import deque
+from collections import OrderedDict
 
 # pylint: disable=unused-import
 try:
-    from typing import Any, Collection, Deque, Dict, Iterable, Mapping, List, Optional
+    from typing import Any, Collection, Iterable, Mapping, List, Optional
     from .result_set import Row, Value
 except ImportError:
     pass
@@ -80,6 +80,8 @@ class Cursor(object):
             raise StopIteration
         return row
 
+    __next__ = next
+
     def close(self):
         # type: () -> None
         """Close this cursor."""
@@ -252,8 +254,8 @@ class StatementCache(object):
         # type: (EncodedSession, int) -> None
         self._session = session
         self._statement = self._session.create_statement()
-        self._ps_cache = dict()  # type: Dict[str, PreparedStatement]
-        self._ps_key_queue = deque()  # type: Deque[str]
+        # Ordered from least to most recently used
+        self._ps_cache = OrderedDict()  # type: OrderedDict[str, PreparedStatement]
         self._ps_cache_size = prepared_statement_cache_size
 
     def get_statement(self):
@@ -266,25 +268,21 @@ class StatementCache(object):
         """Return a PreparedStatement for the provided query.
 
         If we don't have a cached PreparedStatement then create one and add it
-        to the cache.  If we do have one move it to the front of the queue and
+        to the cache.  If we do have one mark it as the most recently used and
         return it.
         :returns: A PreparedStatement for the given query.
         """
-        statement = self._ps_cache.get(query)
+        statement = self._ps_cache.pop(query, None)
         if statement is not None:
-            self._ps_key_queue.remove(query)
-            self._ps_key_queue.append(query)
+            self._ps_cache[query] = statement
             return statement
 
         statement = self._session.create_prepared_statement(query)
 
         while len(self._ps_cache) >= self._ps_cache_size:
-            lru_statement_key = self._ps_key_queue.popleft()
-            statement_to_remove = self._ps_cache[lru_statement_key]
+            _, statement_to_remove = self._ps_cache.popitem(last=False)
             self._session.close_statement(statement_to_remove)
-            del self._ps_cache[lru_statement_key]
 
-        self._ps_key_queue.append(query)
         self._ps_cache[query] = statement
 
         return statement
@@ -299,4 +297,3 @@ class StatementCache(object):
             self._session.close_statement(statement_to_remove)
 
         self._ps_cache.clear()
-        self._ps_key_queue.clear()
@@ -18,7 +18,7 @@ import sys
 
 try:
     from typing import Any, Collection, Dict, Iterable, List  # pylint: disable=unused-import
-    from typing import Mapping, Optional, Tuple  # pylint: disable=unused-import
+    from typing import Mapping, Optional, Tuple, Union  # pylint: disable=unused-import
     from .result_set import Row, Value           # pylint: disable=unused-import
 except ImportError:
     pass
@@ -520,19 +520,28 @@ class EncodedSession(Session):  # pylint: disable=too-many-public-methods
         return self
 
     def putOpaque(self, value):
-        # type: (datatype.Binary) -> EncodedSession
+        # type: (Union[datatype.Binary, bytearray, memoryview]) -> EncodedSession
         """Append an Opaque data value to the message.
 
-        :type value: datatype.Binary
+        :type value: datatype.Binary, bytearray, or memoryview
         """
-        length = len(value)
+        data = value  # type: Union[datatype.Binary, bytearray, memoryview, bytes]
+        if isinstance(value, memoryview):
+            # Send the view's raw bytes.  A C-contiguous view of any shape or
+            # item size can be flattened without a copy; any other view (and
+            # any view on Python 2, which has no cast()) must be copied.
+            if not isP2 and value.c_contiguous:
+                data = value.cast('B')
+            else:
+                data = value.tobytes()
+        length = len(data)
         if length < 40:
             self.__output.append(protocol.OPAQUELEN0 + length)
         else:
             lenData = toByteString(length)
             self.__output.append(protocol.OPAQUECOUNT0 + len(lenData))
             self.__output += lenData
-        self.__output += value
+        self.__output += data
         return self
 
     def putBoolean(self, value):
@@ -713,7 +722,7 @@ class EncodedSession(Session):  # pylint: disable=too-many-public-methods
         if isinstance(value, datatype.Time):
             return self.putScaledTime(value)
 
-        if isinstance(value, datatype.Binary):
+        if isinstance(value, (datatype.Binary, bytearray, memoryview)):
             return self.putOpaque(value)
 
         if isinstance(value, bool):
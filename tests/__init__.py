@@ -25,6 +25,12 @@ DATABASE_NAME = 'pynuodb_test'
 DBA_USER      = 'dba'
 DBA_PASSWORD  = 'dba_password'
 
+# Each pytest-xdist worker uses its own schema so that workers running in
+# parallel against the same database don't collide on table names.
+TEST_SCHEMA = 'test'
+if os.environ.get('PYTEST_XDIST_WORKER'):
+    TEST_SCHEMA += '_' + os.environ['PYTEST_XDIST_WORKER']
+
 ar_path = None
 sql_host = None
 db_created = False
@@ -34,6 +40,18 @@ db_started = False
 _package_setup = False
 
 
+def check_not_xdist():
+    """Refuse to create, start or remove the database under pytest-xdist.
+
+    Every xdist worker runs the package setup and teardown on its own, so
+    the workers would race to create the database and the first one to
+    finish would shut it down under the others.
+    """
+    if os.environ.get('PYTEST_XDIST_WORKER'):
+        raise Exception("Database %s must be RUNNING before the tests are run"
+                        " with pytest-xdist" % (DATABASE_NAME))
+
+
 def get_sqlhost():
     global sql_host
     return sql_host
@@ -48,7 +66,7 @@ def waitforsql(tmout):
             try:
                 conn = pynuodb.connect(database=DATABASE_NAME, host=get_sqlhost(),
                                        user=DBA_USER, password=DBA_PASSWORD,
-                                       options={'schema': 'test'})
+                                       options={'schema': TEST_SCHEMA})
                 return
             except pynuodb.session.SessionException:
                 pass
@@ -117,6 +135,8 @@ def setUpPackage_pynuoadmin():
         logging.info("Reusing already-running database %s" % (db.state))
         return
 
+    check_not_xdist()
+
     # Find an AP running on the local host
     myhost = set(['localhost', socket.getfqdn(), socket.gethostname()])
     for ap in ap_conn.get_servers():
@@ -253,6 +273,8 @@ def setUpPackage_nuocmd():
                 logging.info("Database is already RUNNING")
                 return
 
+    check_not_xdist()
+
     (ret, out) = nuocmd(['--show-json', 'get', 'archives',
                          '--db-name', DATABASE_NAME])
     if ret == 0:
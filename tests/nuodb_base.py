@@ -9,7 +9,7 @@ import unittest
 
 import pynuodb
 
-from . import DATABASE_NAME, DBA_USER, DBA_PASSWORD
+from . import DATABASE_NAME, DBA_USER, DBA_PASSWORD, TEST_SCHEMA
 from . import get_ap_conn, nuocmd, cvtjson, get_sqlhost
 
 
@@ -22,18 +22,65 @@ class NuoBase(unittest.TestCase):
 
     lower_func = 'lower'  # For stored procedure test
 
+    # Connection shared by all the tests in a class: see _shared_connect()
+    _shared_con = None
+    # Cursor on the shared connection: see _shared_cursor()
+    _shared_cur = None
+    # True when the last tearDown() in this class found the database
+    # running: see setUp()
+    _db_verified = False
+
     @classmethod
     def setUpClass(cls):
         super(NuoBase, cls).setUpClass()
+        cls._db_verified = False
         cls.host = get_sqlhost()
         cls.longMessage = True
 
+    @classmethod
+    def tearDownClass(cls):
+        try:
+            if cls._shared_con is not None:
+                cls._shared_con.close()
+        finally:
+            cls._db_verified = False
+            cls._shared_cur = None
+            cls._shared_con = None
+            super(NuoBase, cls).tearDownClass()
+
+    @classmethod
+    def _shared_connect(cls):
+        """Return a connection shared by all the tests in this class.
+
+        The connection is opened on first use and closed by tearDownClass()
+        so tests using it must not close it themselves.
+        """
+        if cls._shared_con is None:
+            con = cls._connect()
+            # Warm up the new session before handing it out.
+            cursor = con.cursor()
+            cursor.execute("select 1 from dual")
+            cursor.close()
+            cls._shared_con = con
+        return cls._shared_con
+
+    @classmethod
+    def _shared_cursor(cls):
+        """Return a cursor on the shared connection, kept for the whole class.
+
+        The cursor's prepared statement cache carries over from one test to
+        the next, so statements the tests have in common are prepared once.
+        """
+        if cls._shared_cur is None:
+            cls._shared_cur = cls._shared_connect().cursor()
+        return cls._shared_cur
+
     @classmethod
     def _connect(cls, options=None):
         if options is None:
-            options = {'schema': 'test'}
+            options = {'schema': TEST_SCHEMA}
         elif 'schema' not in options:
-            options['schema'] = 'test'
+            options['schema'] = TEST_SCHEMA
 
         return pynuodb.connect(database=DATABASE_NAME, host=cls.host,
                                user=DBA_USER, password=DBA_PASSWORD,
@@ -41,10 +88,20 @@ class NuoBase(unittest.TestCase):
 
     def setUp(self):
         super(NuoBase, self).setUp()
-        self.verifydb()
+        # Within a class, setUp() directly follows the previous test's
+        # tearDown(): skip the check if that tearDown() just passed it.
+        # setUpClass() clears the flag, so each class's first test checks.
+        if not type(self)._db_verified:
+            self.verifydb()
 
     def tearDown(self):
+        type(self)._db_verified = False
+        # Discard anything a test left uncommitted on the shared connection,
+        # including after a failure, so it cannot leak into the next test.
+        if self._shared_con is not None:
+            self._shared_con.rollback()
         self.verifydb()
+        type(self)._db_verified = True
         super(NuoBase, self).tearDown()
 
     def verifydb(self):
@@ -8,6 +8,8 @@ See the LICENSE file provided with this software.
 """
 
 import unittest
+import array
+import datetime
 import decimal
 import time
 import os
@@ -19,7 +21,99 @@ from .mock_tzs import Local
 from pynuodb.exception import DataError
 
 
+TESTDIR = os.path.dirname(os.path.realpath(__file__))
+
+# Large payloads for the long string and binary tests: read them only once.
+with open(os.path.join(TESTDIR, "holmes.txt"), "rb") as f:
+    HOLMES_TEXT = f.read().decode('utf-8')
+with open(os.path.join(TESTDIR, "640px-Starling.JPG"), "rb") as f:
+    STARLING_BYTES = f.read()
+
+# Number of copies of the test values the parameterized tests insert in one
+# executemany() batch.
+BATCH_ROWS = 1000
+
+# Columns of typetest_numeric filled in by the parameterized numeric tests.
+NUMERIC_COLUMNS = ('smallint_col', 'integer_col', 'bigint_col', 'numeric_col', 'decimal_col', 'double_col')
+
+# Tables used by the type tests as (name, columns).  They are created once
+# by setUpClass().  The type tests never commit, so tearDown() rolls their
+# rows back and every test starts with an empty table.
+TYPETEST_TABLES = (
+    ('typetest_numeric',
+     "smallint_col smallint, integer_col integer, bigint_col bigint, "
+     "numeric_col numeric(10, 2), decimal_col decimal(10, 2), double_col double"),
+    ('typetest_double',
+     "smallint_col float, int_col double precision, bigint_col double, "
+     "smallnegint_col double, negint_col double, bignegint_col double, double_col double"),
+    ('typetest_string',
+     "string_col string, varchar_col varchar(10), char_col char(10), clob_col clob"),
+    ('typetest_long_string',
+     "string_col string, clob_col clob"),
+    ('typetest_utf8',
+     "string_col string, varchar_col varchar(10), char_col char(10)"),
+    ('typetest_date',
+     "date_col date, time_col time, timestamp_col_EDT timestamp, timestamp_col_EST timestamp"),
+    ('typetest_param_date',
+     "date_col date, time_col time, timestamp_col timestamp"),
+    ('typetest_other',
+     "bool_col boolean, binary_col binary(20)"),
+    ('typetest_param_other',
+     "bool_col boolean, binary_col binary(10)"),
+    ('typetest_binary',
+     "binary_col binary(100000)"),
+    ('typetest_time_micro',
+     "time_col time, timestamp_col timestamp"),
+    ('typetest_all',
+     "binary_col binary(10), bool_col boolean, timestamp_col timestamp, time_col time, "
+     "date_col date, string_col string, varchar_col varchar(10), char_col char(10), "
+     "smallint_col smallint, integer_col integer, bigint_col bigint, "
+     "numeric_col numeric(10, 2), decimal_col decimal(10, 2), double_col double, "
+     "clob_col clob, blob_col blob"),
+    ('typetest_date_error',
+     "date_col date"),
+)
+
+
+def _decimal_table(precision, scale):
+    """Return the name of the table with a NUMERIC(precision, scale) column."""
+    return 'typetest_decimal_%d_%d' % (precision, scale)
+
+
+# NUMERIC(precision, scale) shapes used by the decimal fixtures: each one
+# gets its own table so the fixtures don't need any DDL.
+DECIMAL_SHAPES = ((4, 0), (5, 0), (5, 3), (10, 0), (19, 0), (25, 2), (38, 12))
+TYPETEST_TABLES += tuple((_decimal_table(*shape), "x numeric(%d, %d)" % shape)
+                         for shape in DECIMAL_SHAPES)
+
+
 class NuoDBBasicTest(NuoBase):
+    @classmethod
+    def setUpClass(cls):
+        super(NuoDBBasicTest, cls).setUpClass()
+        con = cls._shared_connect()
+        cursor = con.cursor()
+        for name, columns in TYPETEST_TABLES:
+            cursor.execute("drop table %s if exists" % (name))
+            cursor.execute("create table %s (id integer GENERATED ALWAYS AS IDENTITY, %s)"
+                           % (name, columns))
+        con.commit()
+        cursor.close()
+
+    @classmethod
+    def tearDownClass(cls):
+        try:
+            con = cls._shared_connect()
+            cursor = con.cursor()
+            for name, _ in TYPETEST_TABLES:
+                cursor.execute("drop table %s if exists" % (name))
+            # test_timezones still creates this table itself.
+            cursor.execute("drop table typetest if exists")
+            con.commit()
+            cursor.close()
+        finally:
+            super(NuoDBBasicTest, cls).tearDownClass()
+
     def connectManyTimesUsingOptions(self, options):
         connected_node_ids = set()
         for _ in range(10):
@@ -28,161 +122,98 @@ class NuoDBBasicTest(NuoBase):
                 cursor = con.cursor()
 
                 cursor.execute("select nodeId from system.localtransactions where id=gettransactionid()")
-                rows = cursor.fetchall()
-
-                for row in rows:
-                    connected_node_ids.add(row[0])
+                connected_node_ids.update(row[0] for row in cursor)
             finally:
                 con.close()
         return connected_node_ids
 
     def assertMultipleTEsRunning(self):
-        con = self._connect()
-        try:
-            cursor = con.cursor()
-            cursor.execute("select id from system.nodes where type = 'Transaction'")
-            rows = cursor.fetchall()
-            transaction_node_ids = set()
-            for row in rows:
-                transaction_node_ids.add(row[0])
-        finally:
-            con.close()
+        cursor = self._shared_cursor()
+        cursor.execute("select id from system.nodes where type = 'Transaction'")
+        transaction_node_ids = set(row[0] for row in cursor)
         self.assertGreaterEqual(len(transaction_node_ids), 2, "Test requires 2+ TEs")
 
     def test_noop(self):
-        con = self._connect()
-        try:
-            cursor = con.cursor()
-            cursor.execute("select 1 from dual")
-            row = cursor.fetchone()
-            self.assertEqual(len(row), 1)
-            self.assertEqual(row[0], 1)
-        finally:
-            con.close()
+        cursor = self._shared_cursor()
+        cursor.execute("select 1 from dual")
+        row = cursor.fetchone()
+        self.assertEqual(len(row), 1)
+        self.assertEqual(row[0], 1)
+
+    def _test_param_types(self, table, columns, test_vals):
+        # Insert BATCH_ROWS copies of test_vals
+        self._test_param_rows(table, columns, [test_vals] * BATCH_ROWS)
+
+    def _test_param_rows(self, table, columns, rows):
+        # Insert the rows into the given columns as one batch, then check
+        # that every row reads back unchanged and in order
+        cursor = self._shared_cursor()
+        cursor.executemany("insert into %s (%s) values (%s)"
+                           % (table, ", ".join(columns), ", ".join("?" * len(columns))),
+                           rows)
+
+        self._assert_rows(cursor, table, rows)
+
+    def _assert_rows(self, cursor, table, expected):
+        # Check that the table holds exactly the expected rows, in insertion
+        # order, ignoring the identity column
+        cursor.execute("select * from %s order by id" % (table))
+        rows = [row[1:] for row in cursor.fetchall()]
+        expected = list(expected)
+        if rows == expected:
+            return
+
+        # A diff of two large batches is unreadable: report the first row
+        # that differs column by column instead.
+        self.assertEqual(len(rows), len(expected), "Wrong number of rows in %s" % (table))
+        names = [col[0] for col in cursor.description[1:]]
+        for num, (row, exp) in enumerate(zip(rows, expected)):
+            if row != exp:
+                diffs = ["%s: %r != %r" % (name, got, want)
+                         for name, got, want in zip(names, row, exp) if got != want]
+                self.fail("Row %d of %s differs:\n%s"
+                          % (num, table, "\n".join(diffs or ["%r != %r" % (row, exp)])))
 
     def test_numeric_types(self):
-        con = self._connect()
-        cursor = con.cursor()
-        cursor.execute("drop table typetest if exists")
-        try:
-            cursor.execute("create table typetest (id integer GENERATED ALWAYS AS IDENTITY, smallint_col smallint, integer_col integer, bigint_col bigint, "
-                           "numeric_col numeric(10, 2), decimal_col decimal(10, 2), double_col double precision)")
+        cursor = self._shared_cursor()
 
-            # Basic test
-            cursor.execute("insert into typetest (smallint_col, integer_col, bigint_col, numeric_col, decimal_col, double_col) "
-                           "values (0, 0, 0, 0, 0, 0)")
-
-            con.commit()
+        # Basic test
+        cursor.execute("insert into typetest_numeric (smallint_col, integer_col, bigint_col, numeric_col, decimal_col, double_col) "
+                       "values (0, 0, 0, 0, 0, 0)")
 
-            cursor.execute("select * from typetest order by id desc limit 1")
-            row = cursor.fetchone()
-
-            for i in range(1, len(row)):
-                self.assertEqual(row[i], 0)
-
-        finally:
-            try:
-                cursor.execute("drop table typetest if exists")
-            finally:
-                con.close()
+        self._assert_rows(cursor, 'typetest_numeric', [(0,) * 6])
 
     def test_double_precision(self):
-        con = self._connect()
-        cursor = con.cursor()
-        cursor.execute("drop table typetest if exists")
-        try:
-            cursor.execute("create table typetest (id integer GENERATED ALWAYS AS IDENTITY, smallint_col float, int_col double precision, bigint_col double, "
-                           "smallnegint_col double, negint_col double, bignegint_col double, double_col double)")
+        cursor = self._shared_cursor()
 
-            test_vals = (1, 100000, 10000000000000000, -1, -100000, -10000000000000000, 0.000000000001)
-            cursor.execute("insert into typetest (smallint_col, int_col, bigint_col, smallnegint_col, negint_col, bignegint_col, double_col) "
-                           "values (%s, %s, %s, %s, %s, %s, %s)" % (str(test_vals[0]), str(test_vals[1]), str(test_vals[2]), str(test_vals[3]), str(test_vals[4]), str(test_vals[5]), str(test_vals[6])))
-
-            con.commit()
-            cursor.execute("select * from typetest order by id desc limit 1")
-            row = cursor.fetchone()
+        test_vals = (1, 100000, 10000000000000000, -1, -100000, -10000000000000000, 0.000000000001)
+        cursor.execute("insert into typetest_double (smallint_col, int_col, bigint_col, smallnegint_col, negint_col, bignegint_col, double_col) "
+                       "values (?, ?, ?, ?, ?, ?, ?)", test_vals)
 
-            for i in range(1, len(row)):
-                self.assertEqual(row[i], test_vals[i - 1])
-
-        finally:
-            try:
-                cursor.execute("drop table typetest if exists")
-            finally:
-                con.close()
+        self._assert_rows(cursor, 'typetest_double', [test_vals])
 
     def test_param_numeric_types(self):
-        con = self._connect()
-        cursor = con.cursor()
-        cursor.execute("drop table typetest if exists")
-        try:
-            cursor.execute("create table typetest (id integer GENERATED ALWAYS AS IDENTITY, smallint_col smallint, integer_col integer, bigint_col bigint, "
-                           "numeric_col numeric(10, 2), decimal_col decimal(10, 2), double_col double)")
-
-            test_vals = (0, 0, 0, decimal.Decimal(0), decimal.Decimal(0), 0.0)
-            cursor.execute("insert into typetest (smallint_col, integer_col, bigint_col, numeric_col, decimal_col, double_col) "
-                           "values (?, ?, ?, ?, ?, ?)", test_vals)
-
-            cursor.execute("select * from typetest order by id desc limit 1")
-            row = cursor.fetchone()
-
-            for i in range(1, len(row)):
-                self.assertEqual(row[i], test_vals[i - 1])
-
-        finally:
-            try:
-                cursor.execute("drop table typetest if exists")
-            finally:
-                con.close()
+        test_vals = (0, 0, 0, decimal.Decimal(0), decimal.Decimal(0), 0.0)
+        self._test_param_types('typetest_numeric', NUMERIC_COLUMNS, test_vals)
 
     def test_param_numeric_types_pos(self):
-        con = self._connect()
-        cursor = con.cursor()
-        cursor.execute("drop table typetest if exists")
-        try:
-            cursor.execute("create table typetest (id integer GENERATED ALWAYS AS IDENTITY, smallint_col smallint, integer_col integer, bigint_col bigint, "
-                           "numeric_col numeric(10, 2), decimal_col decimal(10, 2), double_col double)")
-
-            test_vals = (3424, 23453464, 45453453454545, decimal.Decimal('234355.33'), decimal.Decimal('976.2'), 10000.999)
-            cursor.execute("insert into typetest (smallint_col, integer_col, bigint_col, numeric_col, decimal_col, double_col) "
-                           "values (?, ?, ?, ?, ?, ?)", test_vals)
-
-            cursor.execute("select * from typetest order by id desc limit 1")
-            row = cursor.fetchone()
-
-            for i in range(1, len(row)):
-                self.assertEqual(row[i], test_vals[i - 1])
-
-        finally:
-            try:
-                cursor.execute("drop table typetest if exists")
-            finally:
-                con.close()
+        test_vals = (3424, 23453464, 45453453454545, decimal.Decimal('234355.33'), decimal.Decimal('976.2'), 10000.999)
+        self._test_param_types('typetest_numeric', NUMERIC_COLUMNS, test_vals)
 
-    def _test_decimal_fixture(self, value, precision, scale):
-        con = self._connect()
-        cursor = con.cursor()
-        cursor.execute("DROP TABLE CASCADE t IF EXISTS")
-        try:
-            cursor.execute("CREATE TABLE t (x NUMERIC(%s,%s))" % (precision, scale))
-            cursor.execute("INSERT INTO t (x) VALUES (?)", (value,))
-            cursor.execute("SELECT * FROM t")
-            row = cursor.fetchone()
-            self.assertEqual(row[0], value)
-        finally:
-            try:
-                cursor.execute("DROP TABLE t IF EXISTS")
-            finally:
-                con.close()
+    def _test_decimal_fixture(self, values, precision, scale):
+        # Insert all the values as one batch and read them back in order
+        table = _decimal_table(precision, scale)
+        cursor = self._shared_cursor()
+        cursor.executemany("INSERT INTO %s (x) VALUES (?)" % (table), [(value,) for value in values])
+        cursor.execute("SELECT x FROM %s ORDER BY id" % (table))
+        self.assertEqual([row[0] for row in cursor.fetchall()], list(values))
 
     def _test_faulty_decimal_fixture(self, value, precision, scale):
-        con = self._connect()
-        cursor = con.cursor()
-        cursor.execute("DROP TABLE CASCADE t IF EXISTS")
+        table = _decimal_table(precision, scale)
+        cursor = self._shared_cursor()
         try:
-            cursor.execute("CREATE TABLE t (x NUMERIC(%s,%s))" % (precision, scale))
-            cursor.execute("INSERT INTO t (x) VALUES (?)", (value,))
-            cursor.execute("SELECT * FROM t")
+            cursor.execute("INSERT INTO %s (x) VALUES (?)" % (table), (value,))
+            cursor.execute("SELECT * FROM %s" % (table))
             self.fail("Incorrectly inserted %s as NUMERIC(%s,%s)"
                       % (str(value), str(precision), str(scale)))
 
@@ -190,15 +221,9 @@ class NuoDBBasicTest(NuoBase):
             # Older versions of NuoDB would throw a CONSTRAINT_ERROR.
             # Newer versions throw a CONVERSION_ERROR.
             msg = str(err)
-            if 'CONSTRAINT_ERROR' not in msg and 'CONVERSION_ERROR' not in msg:
+            if msg.split(':', 1)[0] not in ('CONSTRAINT_ERROR', 'CONVERSION_ERROR'):
                 self.fail("Unexpected DataError: %s" % (msg))
 
-        finally:
-            try:
-                cursor.execute("DROP TABLE t IF EXISTS")
-            finally:
-                con.close()
-
     # Test the edge cases of the smallint type
     def test_small_decimal(self):
         numbers = (
@@ -207,8 +232,7 @@ class NuoDBBasicTest(NuoBase):
             0x7fff,
             -0x8000,
         )
-        for number in numbers:
-            self._test_decimal_fixture(number, 5, 0)
+        self._test_decimal_fixture(numbers, 5, 0)
         # Test Invalid values
         self._test_faulty_decimal_fixture(32768, 4, 0)
         self._test_faulty_decimal_fixture(-32769, 4, 0)
@@ -221,8 +245,7 @@ class NuoDBBasicTest(NuoBase):
             0x7FFFFFFF,
             -0x80000000,
         )
-        for number in numbers:
-            self._test_decimal_fixture(number, 10, 0)
+        self._test_decimal_fixture(numbers, 10, 0)
         # Test Invalid values
         self._test_faulty_decimal_fixture(2147483648, 4, 0)
         self._test_faulty_decimal_fixture(-2147483649, 4, 0)
@@ -235,19 +258,21 @@ class NuoDBBasicTest(NuoBase):
             0x7FFFFFFFFFFFFFFF,
             -0x8000000000000000,
         )
-        for number in numbers:
-            self._test_decimal_fixture(number, 19, 0)
+        self._test_decimal_fixture(numbers, 19, 0)
         # Test Invalid values
         # We can't use larger values in Perl 3: it won't fit
         self._test_faulty_decimal_fixture(9223372036854775807, 4, 0)
         self._test_faulty_decimal_fixture(-9223372036854775808, 4, 0)
 
     def test_many_significant_digits(self):
-        self._test_decimal_fixture(decimal.Decimal("31943874831932418390.01"), 38, 12)
-        self._test_decimal_fixture(decimal.Decimal("-31943874831932418390.01"), 38, 12)
+        numbers = (
+            decimal.Decimal("31943874831932418390.01"),
+            decimal.Decimal("-31943874831932418390.01"),
+        )
+        self._test_decimal_fixture(numbers, 38, 12)
 
     def test_numeric_no_decimal(self):
-        self._test_decimal_fixture(decimal.Decimal("1.000"), 5, 3)
+        self._test_decimal_fixture((decimal.Decimal("1.000"),), 5, 3)
 
     # This test case produces at least three different defects, perhaps
     # more under the covers.
@@ -258,193 +283,60 @@ class NuoDBBasicTest(NuoBase):
             decimal.Decimal('1.521E+15'),
             decimal.Decimal('00000000000000.1E+12'),
         )
-        for number in numbers:
-            self._test_decimal_fixture(number, 25, 2)
+        self._test_decimal_fixture(numbers, 25, 2)
 
     def test_param_numeric_types_neg(self):
-        con = self._connect()
-        cursor = con.cursor()
-        cursor.execute("drop table typetest if exists")
-        try:
-            cursor.execute("create table typetest (id integer GENERATED ALWAYS AS IDENTITY, smallint_col smallint, integer_col integer, bigint_col bigint, "
-                           "numeric_col numeric(10, 2), decimal_col decimal(10, 2), double_col double)")
-
-            test_vals = (-13546, -156465465, -3135135132132104354, decimal.Decimal('-354564.12'), decimal.Decimal('-77788864.6'), -999.999999)
-            cursor.execute("insert into typetest (smallint_col, integer_col, bigint_col, numeric_col, decimal_col, double_col) "
-                           "values (?, ?, ?, ?, ?, ?)", test_vals)
-
-            cursor.execute("select * from typetest order by id desc limit 1")
-            row = cursor.fetchone()
-
-            for i in range(1, len(row)):
-                self.assertEqual(row[i], test_vals[i - 1])
-
-        finally:
-            try:
-                cursor.execute("drop table typetest if exists")
-            finally:
-                con.close()
+        test_vals = (-13546, -156465465, -3135135132132104354, decimal.Decimal('-354564.12'), decimal.Decimal('-77788864.6'), -999.999999)
+        self._test_param_types('typetest_numeric', NUMERIC_COLUMNS, test_vals)
 
     def test_overflow_numeric_types(self):
-        con = self._connect()
-        cursor = con.cursor()
-        cursor.execute("drop table typetest if exists")
-        try:
-            cursor.execute("create table typetest (id integer GENERATED ALWAYS AS IDENTITY, smallint_col smallint, integer_col integer, bigint_col bigint, "
-                           "numeric_col numeric(10, 2), decimal_col decimal(10, 2), double_col double)")
-
-            with self.assertRaises(pynuodb.DatabaseError):
-                test_vals = (10**99,)
-                cursor.execute("insert into typetest (smallint_col) values (?)",
-                               test_vals)
-
-            with self.assertRaises(pynuodb.DatabaseError):
-                test_vals = (10**99,)
-                cursor.execute("insert into typetest (integer_col) values (?)",
-                               test_vals)
-
-            with self.assertRaises(pynuodb.DatabaseError):
-                test_vals = (10**99,)
-                cursor.execute("insert into typetest (bigint_col,) values (?)",
-                               test_vals)
-
-            with self.assertRaises(pynuodb.DatabaseError):
-                test_vals = (-(10**99),)
-                cursor.execute("insert into typetest (smallint_col) values (?)",
-                               test_vals)
-
-            with self.assertRaises(pynuodb.DatabaseError):
-                test_vals = (-(10**99),)
-                cursor.execute("insert into typetest (integer_col) values (?)",
-                               test_vals)
-
-            with self.assertRaises(pynuodb.DatabaseError):
-                test_vals = (-(10**99),)
-                cursor.execute("insert into typetest (bigint_col,) values (?)",
-                               test_vals)
-
-        finally:
-            try:
-                cursor.execute("drop table typetest if exists")
-            finally:
-                con.close()
+        cursor = self._shared_cursor()
+
+        # Each value must fail on its own; grouping by column lets both
+        # values reuse the column's prepared statement.
+        for column in ('smallint_col', 'integer_col', 'bigint_col'):
+            query = "insert into typetest_numeric (%s) values (?)" % (column)
+            for value in (10**99, -(10**99)):
+                try:
+                    cursor.execute(query, (value,))
+                except pynuodb.DatabaseError:
+                    continue
+                self.fail("%s accepted out of range value %d" % (column, value))
+
+    def _test_into_decimal(self, value):
+        # The server converts the bound value to the column's type
+        cursor = self._shared_cursor()
+        cursor.execute("insert into typetest_numeric (decimal_col) values (?)", (value,))
+        cursor.execute("select decimal_col from typetest_numeric")
+        self.assertEqual(cursor.fetchall(), [(decimal.Decimal(value),)])
 
     def test_int_into_decimal(self):
-        con = self._connect()
-        cursor = con.cursor()
-        cursor.execute("drop table typetest if exists")
-        try:
-            cursor.execute("create table typetest (id integer GENERATED ALWAYS AS IDENTITY, smallint_col smallint, integer_col integer, bigint_col bigint, "
-                           "numeric_col numeric(10, 2), decimal_col decimal(10, 2), double_col double)")
-
-            test_vals = (1,)
-            cursor.execute("insert into typetest (decimal_col) values (?)",
-                           test_vals)
-            cursor.execute("select decimal_col from typetest order by id desc limit 1")
-            row = cursor.fetchone()
-            self.assertEqual(row[0], decimal.Decimal(test_vals[0]))
-
-        finally:
-            try:
-                cursor.execute("drop table typetest if exists")
-            finally:
-                con.close()
+        self._test_into_decimal(1)
 
     def test_string_into_decimal(self):
-        con = self._connect()
-        cursor = con.cursor()
-        cursor.execute("drop table typetest if exists")
-        try:
-            cursor.execute("create table typetest (id integer GENERATED ALWAYS AS IDENTITY, smallint_col smallint, integer_col integer, bigint_col bigint, "
-                           "numeric_col numeric(10, 2), decimal_col decimal(10, 2), double_col double)")
-
-            test_vals = ('91.56',)
-            cursor.execute("insert into typetest (decimal_col) values (?)",
-                           test_vals)
-            cursor.execute("select decimal_col from typetest order by id desc limit 1")
-            row = cursor.fetchone()
-            self.assertEqual(row[0], decimal.Decimal(test_vals[0]))
-
-        finally:
-            try:
-                cursor.execute("drop table typetest if exists")
-            finally:
-                con.close()
+        self._test_into_decimal('91.56')
 
     def test_string_types(self):
-        con = self._connect()
-        cursor = con.cursor()
-        cursor.execute("drop table typetest if exists")
-        try:
-            cursor.execute("create table typetest (id integer GENERATED ALWAYS AS IDENTITY, string_col string, "
-                           "varchar_col varchar(10), char_col char(10), clob_col clob)")
+        cursor = self._shared_cursor()
 
-            cursor.execute("insert into typetest (string_col, varchar_col, char_col, clob_col) "
-                           "values ('', '', '', '')")
-
-            cursor.execute("select * from typetest order by id desc limit 1")
-            row = cursor.fetchone()
+        cursor.execute("insert into typetest_string (string_col, varchar_col, char_col, clob_col) "
+                       "values ('', '', '', '')")
 
-            for i in range(1, len(row)):
-                self.assertEqual(row[i], '')
-
-        finally:
-            try:
-                cursor.execute("drop table typetest if exists")
-            finally:
-                con.close()
+        self._assert_rows(cursor, 'typetest_string', [('',) * 4])
 
     def test_param_string_types(self):
-        con = self._connect()
-        cursor = con.cursor()
-        cursor.execute("drop table typetest if exists")
-        try:
-            cursor.execute("create table typetest (id integer GENERATED ALWAYS AS IDENTITY, string_col string, "
-                           "varchar_col varchar(10), char_col char(10), clob_col clob)")
-
-            test_vals = ("The quick brown fox jumpped over the lazy dog.", "The", "Quick", "The quick brown fox jumpped over the lazy dog2.")
-            cursor.execute("insert into typetest (string_col, varchar_col, char_col, clob_col) "
-                           "values (?, ?, ?, ?)", test_vals)
-
-            cursor.execute("select * from typetest order by id desc limit 1")
-            row = cursor.fetchone()
-
-            for i in range(1, len(row)):
-                self.assertEqual(row[i], test_vals[i - 1])
-
-        finally:
-            try:
-                cursor.execute("drop table typetest if exists")
-            finally:
-                con.close()
+        test_vals = ("The quick brown fox jumpped over the lazy dog.", "The", "Quick", "The quick brown fox jumpped over the lazy dog2.")
+        self._test_param_types('typetest_string', ('string_col', 'varchar_col', 'char_col', 'clob_col'), test_vals)
 
     def test_long_string_types(self):
-        con = self._connect()
-        cursor = con.cursor()
-        cursor.execute("drop table typetest if exists")
-        try:
-            cursor.execute("create table typetest (id integer GENERATED ALWAYS AS IDENTITY, string_col string, "
-                           "clob_col clob)")
-
-            # param
-            with open(os.path.join(os.path.dirname(os.path.realpath(__file__)),
-                                   "holmes.txt"), "r") as f:
-                text = f.read()
-            test_vals = (text, text)
-            cursor.execute("insert into typetest (string_col, clob_col) "
-                           "values (?, ?)", test_vals)
-
-            cursor.execute("select * from typetest order by id desc limit 1")
-            row = cursor.fetchone()
+        cursor = self._shared_cursor()
 
-            for i in range(1, len(row)):
-                self.assertEqual(row[i], test_vals[i - 1])
+        # param
+        test_vals = (HOLMES_TEXT, HOLMES_TEXT)
+        cursor.execute("insert into typetest_long_string (string_col, clob_col) "
+                       "values (?, ?)", test_vals)
 
-        finally:
-            try:
-                cursor.execute("drop table typetest if exists")
-            finally:
-                con.close()
+        self._assert_rows(cursor, 'typetest_long_string', [test_vals])
 
     def test_connection_properties(self):
         clientInfo = "NuoDB Python driver"
@@ -465,217 +357,113 @@ class NuoDBBasicTest(NuoBase):
 
     def test_connection(self):
         # Verify the testConnection() method
-        con = self._connect()
-        try:
-            con.testConnection()
-        finally:
-            con.close()
+        con = self._shared_connect()
+        con.testConnection()
 
     def test_utf8_string_types(self):
-        con = self._connect()
-        cursor = con.cursor()
-        cursor.execute("drop table typetest if exists")
-        try:
-            cursor.execute("create table typetest (id integer GENERATED ALWAYS AS IDENTITY, string_col string, "
-                           "varchar_col varchar(10), char_col char(10))")
-
-            # utf-8
-            test_vals = (" 私はガラスを食べられます。それは私を傷つけません。我能吞下玻璃而不伤身体。Я могу есть стекло, оно мне не вредит.", "나는 유리를 먹을", "ฉันกินก")
-            cursor.execute("insert into typetest (string_col, varchar_col, char_col) "
-                           "values (?, ?, ?)", test_vals)
-
-            cursor.execute("select * from typetest order by id desc limit 1")
-            row = cursor.fetchone()
-
-            for i in range(1, len(row)):
-                self.assertEqual(row[i], test_vals[i - 1])
-        finally:
-            try:
-                cursor.execute("drop table typetest if exists")
-            finally:
-                con.close()
+        # utf-8
+        test_vals = (" 私はガラスを食べられます。それは私を傷つけません。我能吞下玻璃而不伤身体。Я могу есть стекло, оно мне не вредит.", "나는 유리를 먹을", "ฉันกินก")
+        self._test_param_types('typetest_utf8', ('string_col', 'varchar_col', 'char_col'), test_vals)
 
     def test_date_types(self):
-        con = self._connect()
-        cursor = con.cursor()
-        cursor.execute("drop table typetest if exists")
-        try:
-            cursor.execute("create table typetest (id integer GENERATED ALWAYS AS IDENTITY, date_col date, "
-                           "time_col time, timestamp_col_EDT timestamp, timestamp_col_EST timestamp)")
-
-            test_vals = (
-                pynuodb.Date(2008, 1, 1),
-                pynuodb.Time(8, 13, 34),
-                pynuodb.Timestamp(2014, 12, 19, 14, 8, 30, 99, Local),
-                pynuodb.Timestamp(2014, 7, 23, 6, 22, 19, 88, Local),
-            )
-            exc_str = ("insert into typetest ("
-                       "date_col, "
-                       "time_col, "
-                       "timestamp_col_EDT, "
-                       "timestamp_col_EST) "
-                       "values (?, ?, ?, ?)")
-            cursor.execute(exc_str, test_vals)
-
-            cursor.execute("select * from typetest order by id desc limit 1")
-            row = cursor.fetchone()
-
-            self.assertIsInstance(row[1], pynuodb.Date)
-            self.assertIsInstance(row[2], pynuodb.Time)
-            self.assertIsInstance(row[3], pynuodb.Timestamp)
-            self.assertIsInstance(row[4], pynuodb.Timestamp)
-
-            self.assertEqual(test_vals[2] - test_vals[3], row[3] - row[4])
+        cursor = self._shared_cursor()
 
-            self.assertEqual(row[1].year, test_vals[0].year)
-            self.assertEqual(row[1].month, test_vals[0].month)
-            self.assertEqual(row[1].day, test_vals[0].day)
-
-            self.assertEqual(row[2].hour, test_vals[1].hour)
-            self.assertEqual(row[2].minute, test_vals[1].minute)
-            self.assertEqual(row[2].second, test_vals[1].second)
-            self.assertEqual(row[2].microsecond, test_vals[1].microsecond)
-
-            self.assertEqual(row[3].year, test_vals[2].year)
-            self.assertEqual(row[3].month, test_vals[2].month)
-            self.assertEqual(row[3].day, test_vals[2].day)
+        test_vals = (
+            pynuodb.Date(2008, 1, 1),
+            pynuodb.Time(8, 13, 34),
+            pynuodb.Timestamp(2014, 12, 19, 14, 8, 30, 99, Local),
+            pynuodb.Timestamp(2014, 7, 23, 6, 22, 19, 88, Local),
+        )
+        exc_str = ("insert into typetest_date ("
+                   "date_col, "
+                   "time_col, "
+                   "timestamp_col_EDT, "
+                   "timestamp_col_EST) "
+                   "values (?, ?, ?, ?)")
+        cursor.execute(exc_str, test_vals)
 
-            self.assertEqual(row[3].hour, test_vals[2].hour)
-            self.assertEqual(row[3].minute, test_vals[2].minute)
-            self.assertEqual(row[3].second, test_vals[2].second)
-            self.assertEqual(row[3].microsecond, test_vals[2].microsecond)
+        cursor.execute("select * from typetest_date")
+        row = cursor.fetchone()
 
-            self.assertEqual(row[4].year, test_vals[3].year)
-            self.assertEqual(row[4].month, test_vals[3].month)
-            self.assertEqual(row[4].day, test_vals[3].day)
-            self.assertEqual(row[4].hour, test_vals[3].hour)
-            self.assertEqual(row[4].minute, test_vals[3].minute)
-            self.assertEqual(row[4].second, test_vals[3].second)
-            self.assertEqual(row[4].microsecond, test_vals[3].microsecond)
+        self.assertEqual(test_vals[2] - test_vals[3], row[3] - row[4])
 
-        finally:
-            try:
-                cursor.execute("drop table typetest if exists")
-            finally:
-                con.close()
+        # The driver returns naive local values: compare the timestamps
+        # without their time zone.  Equality also checks the value types.
+        expected = test_vals[:2] + tuple(ts.replace(tzinfo=None) for ts in test_vals[2:])
+        self.assertEqual(row[1:], expected)
 
     def test_param_date_types(self):
-        con = self._connect()
-        cursor = con.cursor()
-        cursor.execute("drop table typetest if exists")
-        try:
-            cursor.execute("create table typetest (id integer GENERATED ALWAYS AS IDENTITY, date_col date, "
-                           "time_col time, timestamp_col timestamp)")
-
-            test_vals = (pynuodb.Date(1970, 1, 1), pynuodb.Time(0, 0, 0), pynuodb.Timestamp(2010, 12, 31, 19, 0, 0))
-            cursor.execute("insert into typetest (date_col, time_col, timestamp_col) "
-                           "values (?, ?, ?)", test_vals)
-            con.commit()
+        cursor = self._shared_cursor()
 
-            cursor.execute("select * from typetest order by id desc limit 1")
-            row = cursor.fetchone()
-
-            self.assertIsInstance(row[1], pynuodb.Date)
-            self.assertIsInstance(row[2], pynuodb.Time)
-            self.assertIsInstance(row[3], pynuodb.Timestamp)
+        test_vals = (pynuodb.Date(1970, 1, 1), pynuodb.Time(0, 0, 0), pynuodb.Timestamp(2010, 12, 31, 19, 0, 0))
+        cursor.execute("insert into typetest_param_date (date_col, time_col, timestamp_col) "
+                       "values (?, ?, ?)", test_vals)
 
-            self.assertEqual(row[1].year, test_vals[0].year)
-            self.assertEqual(row[1].month, test_vals[0].month)
-            self.assertEqual(row[1].day, test_vals[0].day)
+        cursor.execute("select * from typetest_param_date")
+        row = cursor.fetchone()
 
-            self.assertEqual(row[2].hour, test_vals[1].hour)
-            self.assertEqual(row[2].minute, test_vals[1].minute)
-            self.assertEqual(row[2].second, test_vals[1].second)
-            self.assertEqual(row[2].microsecond, test_vals[1].microsecond)
-
-            self.assertEqual(row[3].year, test_vals[2].year)
-            self.assertEqual(row[3].month, test_vals[2].month)
-            self.assertEqual(row[3].day, test_vals[2].day)
-            self.assertEqual(row[3].hour, test_vals[2].hour)
-            self.assertEqual(row[3].minute, test_vals[2].minute)
-            self.assertEqual(row[3].second, test_vals[2].second)
-            self.assertEqual(row[3].microsecond, test_vals[2].microsecond)
-
-        finally:
-            try:
-                cursor.execute("drop table typetest if exists")
-            finally:
-                con.close()
+        # Equality also checks the Python types: a date never equals a datetime
+        self.assertEqual([col[1] for col in cursor.description[1:]], [pynuodb.DATETIME] * 3)
+        self.assertEqual(row[1:], test_vals)
 
     def test_other_types(self):
-        con = self._connect()
-        cursor = con.cursor()
-        cursor.execute("drop table typetest if exists")
-        try:
-            cursor.execute("create table typetest (id integer GENERATED ALWAYS AS IDENTITY, bool_col boolean, "
-                           "binary_col binary(20))")
-
-            test_vals = (False, pynuodb.Binary("other binary"))
-            cursor.execute("insert into typetest (bool_col, binary_col) values ('%s', '%s')"
-                           % (str(test_vals[0]), str(test_vals[1])))
+        cursor = self._shared_cursor()
 
-            cursor.execute("select * from typetest order by id desc limit 1")
-            row = cursor.fetchone()
+        test_vals = (False, pynuodb.Binary("other binary"))
+        cursor.execute("insert into typetest_other (bool_col, binary_col) values (?, ?)", test_vals)
 
-            for i in range(1, len(row)):
-                self.assertEqual(row[i], test_vals[i - 1])
-        finally:
-            try:
-                cursor.execute("drop table typetest if exists")
-            finally:
-                con.close()
+        self._assert_rows(cursor, 'typetest_other', [test_vals])
 
     def test_param_other_types(self):
-        con = self._connect()
-        cursor = con.cursor()
-        cursor.execute("drop table typetest if exists")
-        try:
-            cursor.execute("create table typetest (id integer GENERATED ALWAYS AS IDENTITY, bool_col boolean, "
-                           "binary_col binary(10))")
+        test_vals = (True, pynuodb.Binary("binary"))
+        self._test_param_types('typetest_param_other', ('bool_col', 'binary_col'), test_vals)
 
-            test_vals = (True, pynuodb.Binary("binary"))
-            cursor.execute("insert into typetest (bool_col, binary_col) values (?, ?)", test_vals)
+    def test_param_binary_types(self):
+        cursor = self._shared_cursor()
 
-            cursor.execute("select * from typetest order by id desc limit 1")
-            row = cursor.fetchone()
+        cursor.execute("insert into typetest_binary (binary_col) values (?)",
+                       (pynuodb.Binary(STARLING_BYTES),))
 
-            for i in range(1, len(row)):
-                self.assertEqual(row[i], test_vals[i - 1])
-        finally:
-            try:
-                cursor.execute("drop table typetest if exists")
-            finally:
-                con.close()
+        cursor.execute("select * from typetest_binary")
+        row = cursor.fetchone()
 
-    def test_param_binary_types(self):
-        con = self._connect()
-        cursor = con.cursor()
-        cursor.execute("drop table typetest if exists")
-        try:
-            cursor.execute("create table typetest (id integer GENERATED ALWAYS AS IDENTITY, binary_col binary(100000))")
+        self.assertIsInstance(row[1], pynuodb.Binary)
+        self.assertEqual(row[1], STARLING_BYTES)
 
-            with open(os.path.join(os.path.dirname(os.path.realpath(__file__)),
-                                   "640px-Starling.JPG"), "rb") as f:
-                data = f.read()
+    def _test_memoryview(self, view):
+        # A memoryview is sent as binary data: its raw bytes, whatever its
+        # shape or item size
+        cursor = self._shared_cursor()
+        cursor.execute("insert into typetest_binary (binary_col) values (?)", (view,))
 
-            test_vals = (pynuodb.Binary(data),)
-            cursor.execute("insert into typetest (binary_col) values (?)",
-                           test_vals)
+        cursor.execute("select * from typetest_binary")
+        row = cursor.fetchone()
 
-            cursor.execute("select * from typetest order by id desc limit 1")
-            row = cursor.fetchone()
+        self.assertIsInstance(row[1], pynuodb.Binary)
+        self.assertEqual(row[1], view.tobytes())
 
-            self.assertIsInstance(row[1], pynuodb.Binary)
-            self.assertEqual(row[1], pynuodb.Binary(data))
+    def test_param_memoryview_types(self):
+        self._test_memoryview(memoryview(STARLING_BYTES))
 
-        finally:
-            try:
-                cursor.execute("drop table typetest if exists")
-            finally:
-                con.close()
+    @unittest.skipIf(sys.version_info[0] < 3, "memoryview.cast() requires Python 3")
+    def test_param_memoryview_2d(self):
+        size = len(STARLING_BYTES) - len(STARLING_BYTES) % 64
+        self._test_memoryview(memoryview(STARLING_BYTES[:size]).cast('B', [size // 64, 64]))
+
+    @unittest.skipIf(sys.version_info[0] < 3, "array has no memoryview support in Python 2")
+    def test_param_memoryview_wide_items(self):
+        self._test_memoryview(memoryview(array.array('i', range(1000))))
+
+    @unittest.skipIf(sys.version_info[0] < 3, "memoryview slicing requires Python 3")
+    def test_param_memoryview_noncontiguous(self):
+        self._test_memoryview(memoryview(STARLING_BYTES)[::2])
 
     @unittest.skipIf(sys.platform.startswith("win"), "time.tzset() does not work on windows")
     def test_timezones(self):
+        # The driver converts timestamps using the process's local time zone
+        # and sends that zone to the TE when it connects, so each zone needs
+        # TZ set, tzset() and a new connection.
+        saved_tz = os.environ.get('TZ')
         try:
             os.environ['TZ'] = 'EST+05EDT,M4.1.0,M10.5.0'
             time.tzset()
@@ -696,13 +484,8 @@ class NuoDBBasicTest(NuoBase):
             cursor.execute("select * from typetest")
             row = cursor.fetchone()
 
-            self.assertEqual(vals[0].year, row[1].year)
-            self.assertEqual(vals[0].month, row[1].month)
-            self.assertEqual(vals[0].day, row[1].day + 1)
-            self.assertEqual(vals[0].hour, (row[1].hour + 3) % 24)
-            self.assertEqual(vals[0].minute, row[1].minute)
-            self.assertEqual(vals[0].second, row[1].second)
-            self.assertEqual(vals[0].microsecond, row[1].microsecond)
+            # Midnight EDT is 21:00 PDT on the previous day
+            self.assertEqual(row[1], vals[0] - datetime.timedelta(hours=3))
             con.close()
 
             os.environ['TZ'] = 'CET-01CST,M4.1.0,M10.5.0'
@@ -712,146 +495,83 @@ class NuoDBBasicTest(NuoBase):
             cursor.execute("select * from typetest")
             row = cursor.fetchone()
 
-            self.assertEqual(vals[0].year, row[1].year)
-            self.assertEqual(vals[0].month, row[1].month)
-            self.assertEqual(vals[0].day, row[1].day)
-            self.assertEqual(vals[0].hour, (row[1].hour - 6) % 24)
-            self.assertEqual(vals[0].minute, row[1].minute)
-            self.assertEqual(vals[0].second, row[1].second)
-            self.assertEqual(vals[0].microsecond, row[1].microsecond)
+            self.assertEqual(row[1], vals[0] + datetime.timedelta(hours=6))
 
-            cursor.execute("drop table typetest if exists")
             con.close()
 
         finally:
-            try:
-                os.environ.pop('TZ')
-            except Exception:
-                pass
+            # Restore the original zone so it does not leak into later tests
+            if saved_tz is None:
+                os.environ.pop('TZ', None)
+            else:
+                os.environ['TZ'] = saved_tz
+            time.tzset()
 
     def test_param_time_micro_types(self):
-        con = self._connect()
-        cursor = con.cursor()
-        cursor.execute("drop table typetest if exists")
-        try:
-            cursor.execute("create table typetest (id integer GENERATED ALWAYS AS IDENTITY, time_col time, timestamp_col timestamp)")
-
-            test_vals = (pynuodb.Time(5, 8, 20, 12), pynuodb.Timestamp(1999, 12, 31, 19, 0, 0, 1400))
-            cursor.execute("insert into typetest (time_col, timestamp_col) values (?, ?)",
-                           test_vals)
-            con.commit()
+        cursor = self._shared_cursor()
 
-            cursor.execute("select * from typetest order by id desc limit 1")
-            row = cursor.fetchone()
-
-            self.assertIsInstance(row[1], pynuodb.Time)
-            self.assertIsInstance(row[2], pynuodb.Timestamp)
+        test_vals = (pynuodb.Time(5, 8, 20, 12), pynuodb.Timestamp(1999, 12, 31, 19, 0, 0, 1400))
+        cursor.execute("insert into typetest_time_micro (time_col, timestamp_col) values (?, ?)",
+                       test_vals)
 
-            self.assertEqual(row[1].hour, test_vals[0].hour)
-            self.assertEqual(row[1].minute, test_vals[0].minute)
-            self.assertEqual(row[1].second, test_vals[0].second)
-            self.assertEqual(row[1].microsecond, test_vals[0].microsecond)
+        cursor.execute("select * from typetest_time_micro")
+        row = cursor.fetchone()
 
-            self.assertEqual(row[2].year, test_vals[1].year)
-            self.assertEqual(row[2].month, test_vals[1].month)
-            self.assertEqual(row[2].day, test_vals[1].day)
-            self.assertEqual(row[2].hour, test_vals[1].hour)
-            self.assertEqual(row[2].minute, test_vals[1].minute)
-            self.assertEqual(row[2].second, test_vals[1].second)
-            self.assertEqual(row[2].microsecond, test_vals[1].microsecond)
-
-        finally:
-            try:
-                cursor.execute("drop table typetest if exists")
-            finally:
-                con.close()
+        self.assertEqual([col[1] for col in cursor.description[1:]], [pynuodb.DATETIME] * 2)
+        self.assertEqual(row[1:], test_vals)
 
     def test_all_types(self):
-        con = self._connect()
-        cursor = con.cursor()
-        cursor.execute("drop table typetest if exists")
-        try:
-            cursor.execute("create table typetest (id integer GENERATED ALWAYS AS IDENTITY, binary_col binary(10), "
-                           "bool_col boolean, timestamp_col timestamp, time_col time, date_col date, string_col string, "
-                           "varchar_col varchar(10), char_col char(10), smallint_col smallint, integer_col integer, bigint_col bigint, "
-                           "numeric_col numeric(10, 2), decimal_col decimal(10, 2), double_col double, clob_col clob, blob_col blob)")
-
-            vals = (pynuodb.Binary("binary"),
-                    False,
-                    pynuodb.Timestamp(1990, 12, 31, 19, 0, 0),
-                    pynuodb.Time(10, 30, 44),
-                    pynuodb.Date(1998, 1, 1),
-                    "this",
-                    "is a",
-                    "test",
-                    -13546,
-                    156465465,
-                    -3135135132132104354,
-                    decimal.Decimal('-354564.12'),
-                    decimal.Decimal('77788864.6'),
-                    -999.999999,
-                    "The test",
-                    pynuodb.Binary("test"))
-            cursor.execute("insert into typetest (binary_col, bool_col, timestamp_col, time_col, date_col, string_col, "
-                           "varchar_col, char_col, smallint_col, integer_col, bigint_col, numeric_col, decimal_col, "
-                           "double_col, clob_col, blob_col) values (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", vals)
-            con.commit()
-
-            cursor.execute("select * from typetest order by id desc limit 1")
-            row = cursor.fetchone()
-
-            for i in range(1, 3):
-                self.assertEqual(row[i], vals[i - 1])
-
-            self.assertIsInstance(row[3], pynuodb.Timestamp)
-            self.assertIsInstance(row[4], pynuodb.Time)
-            self.assertIsInstance(row[5], pynuodb.Date)
-
-            self.assertEqual(row[3].year, vals[2].year)
-            self.assertEqual(row[3].month, vals[2].month)
-            self.assertEqual(row[3].day, vals[2].day)
-            self.assertEqual(row[3].hour, vals[2].hour)
-            self.assertEqual(row[3].minute, vals[2].minute)
-            self.assertEqual(row[3].second, vals[2].second)
-            self.assertEqual(row[3].microsecond, vals[2].microsecond)
-
-            self.assertEqual(row[4].hour, vals[3].hour)
-            self.assertEqual(row[4].minute, vals[3].minute)
-            self.assertEqual(row[4].second, vals[3].second)
-            self.assertEqual(row[4].microsecond, vals[3].microsecond)
-
-            self.assertEqual(row[5].year, vals[4].year)
-            self.assertEqual(row[5].month, vals[4].month)
-            self.assertEqual(row[5].day, vals[4].day)
-
-            for i in range(6, len(row)):
-                self.assertEqual(row[i], vals[i - 1])
-
-        finally:
-            try:
-                cursor.execute("drop table typetest if exists")
-            finally:
-                con.close()
+        columns = ('binary_col', 'bool_col', 'timestamp_col', 'time_col', 'date_col', 'string_col',
+                   'varchar_col', 'char_col', 'smallint_col', 'integer_col', 'bigint_col', 'numeric_col',
+                   'decimal_col', 'double_col', 'clob_col', 'blob_col')
+        cases = [
+            (pynuodb.Binary("binary"),
+             False,
+             pynuodb.Timestamp(1990, 12, 31, 19, 0, 0),
+             pynuodb.Time(10, 30, 44),
+             pynuodb.Date(1998, 1, 1),
+             "this",
+             "is a",
+             "test",
+             -13546,
+             156465465,
+             -3135135132132104354,
+             decimal.Decimal('-354564.12'),
+             decimal.Decimal('77788864.6'),
+             -999.999999,
+             "The test",
+             pynuodb.Binary("test")),
+            (pynuodb.Binary("\x00\xff"),
+             True,
+             pynuodb.Timestamp(2038, 1, 19, 3, 14, 7, 999999),
+             pynuodb.Time(23, 59, 59),
+             pynuodb.Date(2000, 2, 29),
+             "",
+             "ten chars!",
+             "c",
+             32767,
+             -2147483648,
+             9223372036854775807,
+             decimal.Decimal('0.01'),
+             decimal.Decimal('-99999999.99'),
+             1e-300,
+             "",
+             pynuodb.Binary("\x00")),
+            # Every column NULL
+            (None,) * len(columns),
+        ]
+
+        # The date and time values are all naive, so whole-row equality also
+        # checks that each of those columns comes back as the right type.
+        # All the cases go in one batch, repeated up to BATCH_ROWS rows.
+        self._test_param_rows('typetest_all', columns, cases * (BATCH_ROWS // len(cases)))
 
     def test_param_date_error(self):
-        con = self._connect()
-        cursor = con.cursor()
-        cursor.execute("drop table typetest if exists")
-        try:
-            cursor.execute("create table typetest (id integer GENERATED ALWAYS AS IDENTITY, date_col date)")
+        cursor = self._shared_cursor()
 
-            test_vals = (pynuodb.Date(1800, 1, 1),)
-            try:
-                cursor.execute("insert into typetest (date_col) values (?)", test_vals)
-            except pynuodb.DataError:
-                pass
-            except Exception:
-                self.fail()
-        finally:
-            try:
-                cursor.execute("drop table typetest if exists")
-            finally:
-                con.close()
+        test_vals = (pynuodb.Date(1800, 1, 1),)
+        with self.assertRaises(pynuodb.DataError):
+            cursor.execute("insert into typetest_date_error (date_col) values (?)", test_vals)
 
 
 if __name__ == '__main__':
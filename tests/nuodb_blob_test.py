@@ -4,26 +4,25 @@ import unittest
 import struct
 
 import pynuodb
-import sys
 from .nuodb_base import NuoBase
 
-systemVersion = sys.version[0]
+# Layout of the binary value the blob test round trips
+BLOB_STRUCT = struct.Struct('hhl')
 
 
 class NuoDBBlobTest(NuoBase):
     def test_blob_prepared(self):
-        con = self._connect()
+        con = self._shared_connect()
         cursor = con.cursor()
 
-        binary_data = struct.pack('hhl', 1, 2, 3)
+        binary_data = BLOB_STRUCT.pack(1, 2, 3)
 
         cursor.execute("SELECT ? FROM DUAL", [pynuodb.Binary(binary_data)])
         row = cursor.fetchone()
 
-        currentRow = str(row[0])
-        if systemVersion == '3':
-            currentRow = bytes(currentRow, 'latin-1')
-        array2 = struct.unpack('hhl', currentRow)
+        # Binary is a bytes subclass: unpack it as it is
+        self.assertIsInstance(row[0], pynuodb.Binary)
+        array2 = BLOB_STRUCT.unpack(row[0])
         self.assertEqual(len(array2), 3)
         self.assertEqual(array2[2], 3)
 
@@ -33,6 +33,25 @@ class NuoDBBasicTest(unittest.TestCase):
                 pynuodb.crypt.fromSignedByteString(pynuodb.crypt.toSignedByteString(val)),
                 val)
 
+    def test_bulkByteString(self):
+        """Test signed and unsigned byte strings over a range of values."""
+        vals = list(range(-(1 << 16), 1 << 16))
+        for shift in range(8, 136, 8):
+            vals += [(1 << shift) - 1, 1 << shift, -(1 << shift), -(1 << shift) - 1]
+        encoded = list(map(pynuodb.crypt.toSignedByteString, vals))
+        self.assertEqual(list(map(pynuodb.crypt.fromSignedByteString, encoded)), vals)
+
+        # The encoding is minimal: one byte, or more only when needed to
+        # keep the sign bit right
+        for val, data in zip(vals, encoded):
+            if len(data) > 1:
+                self.assertNotIn((data[0], data[1] & 0x80), ((0, 0), (255, 0x80)),
+                                 "%d encoded as %r" % (val, data))
+
+        positive = [val for val in vals if val >= 0]
+        encoded = list(map(pynuodb.crypt.toByteString, positive))
+        self.assertEqual(list(map(pynuodb.crypt.fromByteString, encoded)), positive)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -5,11 +5,17 @@ import unittest
 from .nuodb_base import NuoBase
 from pynuodb.exception import DataError, ProgrammingError, BatchError, OperationalError
 
+# Table used by the executemany tests
+EXECUTEMANY_TABLE_DDL = "CREATE TABLE executemany_table (f1 INTEGER, f2 INTEGER)"
+
+# Number of result sets the server lets one connection keep open
+MAX_OPEN_RESULT_SETS = 1000
+
 
 class NuoDBCursorTest(NuoBase):
 
     def test_cursor_description(self):
-        con = self._connect()
+        con = self._shared_connect()
         cursor = con.cursor()
 
         cursor.execute("SELECT 'abc' AS XYZ, 123 AS `123` FROM DUAL")
@@ -28,101 +34,80 @@ class NuoDBCursorTest(NuoBase):
         # self.assertEqual(descriptions[1][2], 5, dstr)
 
     def test_cursor_rowcount_and_last_query(self):
-        con = self._connect()
+        con = self._shared_connect()
         cursor = con.cursor()
         statement = "SELECT 1 FROM DUAL UNION ALL SELECT 2 FROM DUAL"
         cursor.execute(statement)
         self.assertEqual(cursor.rowcount, -1)
         self.assertEqual(cursor.query, statement)
 
+    def test_cursor_iteration(self):
+        con = self._shared_connect()
+        cursor = con.cursor()
+
+        cursor.execute("SELECT 1 FROM DUAL UNION ALL SELECT 2 FROM DUAL")
+        self.assertEqual([row[0] for row in cursor], [1, 2])
+
     def test_insufficient_parameters(self):
-        con = self._connect()
+        con = self._shared_connect()
         cursor = con.cursor()
 
-        try:
+        with self.assertRaises(ProgrammingError):
             cursor.execute("SELECT ?, ? FROM DUAL", [1])
-            self.fail("Expected execute to fail for unsufficient parameters")
-        except ProgrammingError as e:
-            self.assertIsNotNone(e)
 
     def test_toomany_parameters(self):
-        con = self._connect()
+        con = self._shared_connect()
         cursor = con.cursor()
 
-        try:
+        with self.assertRaises(ProgrammingError):
             cursor.execute("SELECT 1 FROM DUAL", [1])
-            self.fail("Expected execute to fail for too many parameters")
-        except ProgrammingError as e:
-            self.assertIsNotNone(e)
 
-        try:
+        with self.assertRaises(ProgrammingError):
             cursor.execute("SELECT ? FROM DUAL", [1, 2])
-            self.fail("Expected execute to fail for too many parameters")
-        except ProgrammingError as e:
-            self.assertIsNotNone(e)
 
     def test_incorrect_parameters(self):
-        con = self._connect()
+        con = self._shared_connect()
         cursor = con.cursor()
 
-        try:
+        with self.assertRaises(DataError):
             cursor.execute("SELECT ? + 1 FROM DUAL", ['abc'])
-            self.fail("Expected execute to fail for wrong parameter type")
-        except DataError as e:
-            self.assertIsNotNone(e)
 
     def test_executemany(self):
-        con = self._connect()
+        con = self._shared_connect()
         cursor = con.cursor()
 
         cursor.execute("DROP TABLE IF EXISTS executemany_table")
-        cursor.execute("CREATE TABLE executemany_table (f1 INTEGER, f2 INTEGER)")
+        cursor.execute(EXECUTEMANY_TABLE_DDL)
         cursor.executemany("INSERT INTO executemany_table VALUES (?, ?)", [[1, 2], [3, 4]])
 
         cursor.execute("SELECT * FROM executemany_table")
 
-        ret = cursor.fetchall()
-
-        self.assertEqual(ret[0][0], 1)
-        self.assertEqual(ret[0][1], 2)
-        self.assertEqual(ret[1][0], 3)
-        self.assertEqual(ret[1][1], 4)
+        self.assertEqual(cursor.fetchall(), [(1, 2), (3, 4)])
 
         cursor.execute("DROP TABLE executemany_table")
 
     def test_executemany_bad_parameters(self):
-        con = self._connect()
+        con = self._shared_connect()
         cursor = con.cursor()
         cursor.execute("DROP TABLE IF EXISTS executemany_table")
-        cursor.execute("CREATE TABLE executemany_table (f1 INTEGER, f2 INTEGER)")
+        cursor.execute(EXECUTEMANY_TABLE_DDL)
         # 3rd tuple has too many params
-        try:
+        with self.assertRaises(ProgrammingError):
             cursor.executemany("INSERT INTO executemany_table VALUES (?, ?)", [[1, 2], [3, 4], [1, 2, 3]])
-            self.fail("Expected executemany to fail for bad parameters")
-        except ProgrammingError as e:
-            self.assertIsNotNone(e)
 
         cursor.execute("DROP TABLE executemany_table")
 
     def test_executemany_somefail(self):
-        con = self._connect()
+        con = self._shared_connect()
         cursor = con.cursor()
         cursor.execute("DROP TABLE IF EXISTS executemany_table")
-        cursor.execute("CREATE TABLE executemany_table (f1 INTEGER, f2 INTEGER)")
+        cursor.execute(EXECUTEMANY_TABLE_DDL)
         cursor.execute('CREATE UNIQUE INDEX "f1idx" ON "executemany_table" ("f1");')
         # 3rd tuple has uniqueness conflict
-        try:
+        with self.assertRaises(BatchError) as cm:
             cursor.executemany("INSERT INTO executemany_table VALUES (?, ?)",
                                [[1, 2], [3, 4], [1, 2], [5, 6], [5, 6]])
-            self.fail("executemany succeeded")
-        except BatchError as e:
-            self.assertEqual(e.results[0], 1)
-            self.assertEqual(e.results[1], 1)
-            self.assertEqual(e.results[2], -3)
-            self.assertEqual(e.results[3], 1)
-            self.assertEqual(e.results[4], -3)
-        except Exception as ex:
-            self.fail("executemany failed with %s" % (str(ex)))
+        self.assertEqual(cm.exception.results, [1, 1, -3, 1, -3])
 
         # test that they all made it save the bogus one
         cursor.execute("select * from executemany_table;")
@@ -131,25 +116,26 @@ class NuoDBCursorTest(NuoBase):
         cursor.execute("DROP TABLE executemany_table")
 
     def test_result_set_gets_closed(self):
-        # Server will throw error after 1000 open result sets
+        # Server will throw error after 1000 open result sets: this test
+        # leaks them deliberately so it needs a connection of its own.
+        # Committing does not close result sets, so the loops don't commit.
         con = self._connect()
-        for j in [False, True]:
-            for i in range(2015):
-                if not j:
-                    cursor = con.cursor()
-                    cursor.execute('select 1 from dual;')
-                    con.commit()
-                    cursor.close()
-                else:
-                    if i >= 1000:
-                        with self.assertRaises(OperationalError):
-                            cursor = con.cursor()
-                            cursor.execute('select 1 from dual;')
-                            con.commit()
-                    else:
-                        cursor = con.cursor()
-                        cursor.execute('select 1 from dual;')
-                        con.commit()
+        try:
+            # Closing each cursor frees its result set: go past the limit
+            for _ in range(MAX_OPEN_RESULT_SETS + 1):
+                cursor = con.cursor()
+                cursor.execute('select 1 from dual;')
+                cursor.close()
+
+            # Leak exactly as many as allowed: the next one must fail
+            for _ in range(MAX_OPEN_RESULT_SETS):
+                cursor = con.cursor()
+                cursor.execute('select 1 from dual;')
+            with self.assertRaises(OperationalError):
+                cursor = con.cursor()
+                cursor.execute('select 1 from dual;')
+        finally:
+            con.close()
 
 
 if __name__ == '__main__':
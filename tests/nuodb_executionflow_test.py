@@ -13,6 +13,10 @@ from pynuodb.exception import Error
 
 
 class NuoDBExecutionFlowTest(NuoBase):
+    # The *_after_disconnect tests close their connection, so they open one
+    # of their own, as does test_execute_ten_million_with_result_sets.  The
+    # others share the class's connection.
+
     def test_commit_after_disconnect(self):
         con = self._connect()
 
@@ -61,7 +65,7 @@ class NuoDBExecutionFlowTest(NuoBase):
             self.assertEqual(str(e), 'connection is closed')
 
     def test_execute_after_close(self):
-        con = self._connect()
+        con = self._shared_connect()
         cursor = con.cursor()
 
         cursor.close()
@@ -73,7 +77,7 @@ class NuoDBExecutionFlowTest(NuoBase):
             self.assertEqual(str(e), 'cursor is closed')
 
     def test_fetchone_without_execute(self):
-        con = self._connect()
+        con = self._shared_connect()
         cursor = con.cursor()
 
         try:
@@ -83,7 +87,7 @@ class NuoDBExecutionFlowTest(NuoBase):
             self.assertEqual(str(e), 'Previous execute did not produce any results or no call was issued yet')
 
     def test_fetchone_after_close(self):
-        con = self._connect()
+        con = self._shared_connect()
         cursor = con.cursor()
         cursor.execute("SELECT 1 FROM DUAL")
         cursor.close()
@@ -95,7 +99,7 @@ class NuoDBExecutionFlowTest(NuoBase):
             self.assertEqual(str(e), 'cursor is closed')
 
     def test_fetchone_on_ddl(self):
-        con = self._connect()
+        con = self._shared_connect()
         cursor = con.cursor()
         cursor.execute("DROP TABLE fetchone_on_ddl IF EXISTS")
 
@@ -106,13 +110,13 @@ class NuoDBExecutionFlowTest(NuoBase):
             self.assertEqual(str(e), 'Previous execute did not produce any results or no call was issued yet')
 
     def test_fetchone_on_empty(self):
-        con = self._connect()
+        con = self._shared_connect()
         cursor = con.cursor()
         cursor.execute("SELECT 1 FROM DUAL WHERE FALSE")
         self.assertIsNone(cursor.fetchone())
 
     def test_fetchone_beyond_eof(self):
-        con = self._connect()
+        con = self._shared_connect()
         cursor = con.cursor()
 
         cursor.execute("SELECT 1 FROM DUAL")
@@ -120,7 +124,7 @@ class NuoDBExecutionFlowTest(NuoBase):
         self.assertIsNone(cursor.fetchone())
 
     def test_fetchmany_beyond_eof(self):
-        con = self._connect()
+        con = self._shared_connect()
         cursor = con.cursor()
 
         cursor.execute("SELECT 1 FROM DUAL UNION ALL SELECT 2 FROM DUAL")
@@ -128,7 +132,7 @@ class NuoDBExecutionFlowTest(NuoBase):
         self.assertEqual(len(many), 2)
 
     def test_fetch_after_error(self):
-        con = self._connect()
+        con = self._shared_connect()
         cursor = con.cursor()
 
         try:
@@ -145,7 +149,7 @@ class NuoDBExecutionFlowTest(NuoBase):
             self.assertEqual(str(e2), 'Previous execute did not produce any results or no call was issued yet')
 
     def test_execute_after_error(self):
-        con = self._connect()
+        con = self._shared_connect()
         cursor = con.cursor()
 
         try:
@@ -159,7 +163,7 @@ class NuoDBExecutionFlowTest(NuoBase):
         cursor.fetchone()
 
     def test_error_after_error(self):
-        con = self._connect()
+        con = self._shared_connect()
         cursor = con.cursor()
 
         try:
@@ -177,16 +181,23 @@ class NuoDBExecutionFlowTest(NuoBase):
                              'SYNTAX_ERROR: syntax error on line 1\nsyntax2 error\n^ expected statement got syntax2\n')
 
     def test_execute_ten_million_with_result_sets(self):
+        # DDL commits implicitly, so keep this test's 10000 uncommitted
+        # inserts off the shared connection and clean up explicitly.
         con = self._connect()
-        cursor = con.cursor()
-        cursor.execute("DROP TABLE IF EXISTS execute_ten_million_with_result_sets")
-        cursor.execute("CREATE TABLE execute_ten_million_with_result_sets (value INTEGER)")
-        for i in range(10000):
-            cursor.execute("insert into execute_ten_million_with_result_sets (value) Values ({:d})".format(i))
-            con.commit()
-            cursor.execute("select count(*) from execute_ten_million_with_result_sets;")
-            res = cursor.fetchone()[0]
-            self.assertEqual(i + 1, res)
+        try:
+            cursor = con.cursor()
+            cursor.execute("DROP TABLE IF EXISTS execute_ten_million_with_result_sets")
+            cursor.execute("CREATE TABLE execute_ten_million_with_result_sets (value INTEGER)")
+            # The inserts share one transaction: the count still sees them all
+            for i in range(10000):
+                cursor.execute("insert into execute_ten_million_with_result_sets (value) Values ({:d})".format(i))
+                cursor.execute("select count(*) from execute_ten_million_with_result_sets;")
+                res = cursor.fetchone()[0]
+                self.assertEqual(i + 1, res)
+        finally:
+            con.rollback()
+            con.cursor().execute("DROP TABLE IF EXISTS execute_ten_million_with_result_sets")
+            con.close()
 
 
 if __name__ == '__main__':
@@ -9,27 +9,43 @@ See the LICENSE file provided with this software.
 
 import unittest
 import decimal
+import contextlib
 
 from .nuodb_base import NuoBase
 
 
+@contextlib.contextmanager
+def typetest_table(con, cursor):
+    """Create a fresh typetest table for the duration of the block.
+
+    The table is dropped using the given cursor and the connection is closed
+    when the block exits.
+    """
+    try:
+        cursor.execute("drop table typetest if exists")
+        cursor.execute("create table typetest (id integer GENERATED ALWAYS AS IDENTITY, smallint_col smallint, "
+                       "integer_col integer, bigint_col bigint, numeric_col numeric(10, 2), "
+                       "decimal_col decimal(10, 2), double_col double)")
+        yield
+    finally:
+        try:
+            cursor.execute("drop table typetest if exists")
+        finally:
+            con.close()
+
+
 class NuoDBStatementManagementTest(NuoBase):
     def test_stable_statement(self):
         con = self._connect()
         cursor = con.cursor()
         init_handle = extract_statement_handle(cursor)
-        cursor.execute("drop table typetest if exists")
-        try:
-            cursor.execute("create table typetest (id integer GENERATED ALWAYS AS IDENTITY, smallint_col smallint, "
-                           "integer_col integer, bigint_col bigint, numeric_col numeric(10, 2), "
-                           "decimal_col decimal(10, 2), double_col double precision)")
-
+        with typetest_table(con, cursor):
             cursor.execute("insert into typetest (smallint_col, integer_col, bigint_col, numeric_col, decimal_col, "
                            "double_col) values (0, 0, 0, 0, 0, 0)")
 
             con.commit()
 
-            cursor.execute("select * from typetest order by id desc limit 1")
+            cursor.execute("select * from typetest")
             row = cursor.fetchone()
 
             for i in range(1, len(row)):
@@ -38,12 +54,6 @@ class NuoDBStatementManagementTest(NuoBase):
             current_handle = extract_statement_handle(cursor)
             self.assertEqual(init_handle, current_handle)
 
-        finally:
-            try:
-                cursor.execute("drop table typetest if exists")
-            finally:
-                con.close()
-
     def test_statement_per_cursor(self):
         con = self._connect()
         try:
@@ -61,12 +71,7 @@ class NuoDBStatementManagementTest(NuoBase):
     def test_prepared_statement_cache(self):
         con = self._connect()
         cursor = con.cursor()
-        cursor.execute("drop table typetest if exists")
-        try:
-            cursor.execute("create table typetest (id integer GENERATED ALWAYS AS IDENTITY, smallint_col smallint, "
-                           "integer_col integer, bigint_col bigint, numeric_col numeric(10, 2), "
-                           "decimal_col decimal(10, 2), double_col double)")
-
+        with typetest_table(con, cursor):
             test_vals = (3424, 23453464, 45453453454545, decimal.Decimal('234355.33'), decimal.Decimal('976.2'),
                          10000.999)
             query = "insert into typetest (smallint_col, integer_col, bigint_col, numeric_col, decimal_col, " \
@@ -74,7 +79,7 @@ class NuoDBStatementManagementTest(NuoBase):
 
             cursor.execute(query, test_vals)
 
-            cursor.execute("select * from typetest order by id desc limit 1")
+            cursor.execute("select * from typetest")
             row = cursor.fetchone()
 
             for i in range(1, len(row)):
@@ -84,21 +89,10 @@ class NuoDBStatementManagementTest(NuoBase):
             self.assertEqual(1, len(ps_cache))
             self.assertIn(query, ps_cache)
 
-        finally:
-            try:
-                cursor.execute("drop table typetest if exists")
-            finally:
-                con.close()
-
     def test_prepared_statement_cache_should_not_grow(self):
         con = self._connect()
         cursor = con.cursor()
-        cursor.execute("drop table typetest if exists")
-        try:
-            cursor.execute("create table typetest (id integer GENERATED ALWAYS AS IDENTITY, smallint_col smallint, "
-                           "integer_col integer, bigint_col bigint, numeric_col numeric(10, 2), "
-                           "decimal_col decimal(10, 2), double_col double)")
-
+        with typetest_table(con, cursor):
             test_vals = (3424, 23453464, 45453453454545, decimal.Decimal('234355.33'), decimal.Decimal('976.2'),
                          10000.999)
             query = "insert into typetest (smallint_col, integer_col, bigint_col, numeric_col, decimal_col, " \
@@ -107,7 +101,7 @@ class NuoDBStatementManagementTest(NuoBase):
             for _ in range(0, 20):
                 cursor.execute(query, test_vals)
 
-            cursor.execute("select * from typetest order by id desc limit 1")
+            cursor.execute("select * from typetest")
             row = cursor.fetchone()
 
             for i in range(1, len(row)):
@@ -117,21 +111,10 @@ class NuoDBStatementManagementTest(NuoBase):
             self.assertEqual(1, len(ps_cache))
             self.assertIn(query, ps_cache)
 
-        finally:
-            try:
-                cursor.execute("drop table typetest if exists")
-            finally:
-                con.close()
-
     def test_prepared_statement_cache_stable(self):
         con = self._connect()
         cursor = con.cursor()
-        cursor.execute("drop table typetest if exists")
-        try:
-            cursor.execute("create table typetest (id integer GENERATED ALWAYS AS IDENTITY, smallint_col smallint, "
-                           "integer_col integer, bigint_col bigint, numeric_col numeric(10, 2), "
-                           "decimal_col decimal(10, 2), double_col double)")
-
+        with typetest_table(con, cursor):
             test_vals = (3424, 23453464, 45453453454545, decimal.Decimal('234355.33'), decimal.Decimal('976.2'),
                          10000.999)
             query = "insert into typetest (smallint_col, integer_col, bigint_col, numeric_col, decimal_col, " \
@@ -141,7 +124,7 @@ class NuoDBStatementManagementTest(NuoBase):
             for _ in range(0, 20):
                 cursor.execute(query, test_vals)
 
-                cursor.execute("select * from typetest order by id desc limit 1")
+                cursor.execute("select * from typetest")
                 row = cursor.fetchone()
 
                 for i in range(1, len(row)):
@@ -155,21 +138,10 @@ class NuoDBStatementManagementTest(NuoBase):
                 else:
                     self.assertEqual(handle, ps_cache[query].handle)
 
-        finally:
-            try:
-                cursor.execute("drop table typetest if exists")
-            finally:
-                con.close()
-
     def test_prepared_statement_cache_should_grow(self):
         con = self._connect()
         cursor = con.cursor()
-        cursor.execute("drop table typetest if exists")
-        try:
-            cursor.execute("create table typetest (id integer GENERATED ALWAYS AS IDENTITY, smallint_col smallint, "
-                           "integer_col integer, bigint_col bigint, numeric_col numeric(10, 2), "
-                           "decimal_col decimal(10, 2), double_col double)")
-
+        with typetest_table(con, cursor):
             test_vals = (3424, 23453464, 45453453454545, decimal.Decimal('234355.33'), decimal.Decimal('976.2'),
                          10000.999)
 
@@ -191,22 +163,11 @@ class NuoDBStatementManagementTest(NuoBase):
             for query in queries:
                 self.assertIn(query, ps_cache)
 
-        finally:
-            try:
-                cursor.execute("drop table typetest if exists")
-            finally:
-                con.close()
-
     def test_prepared_statement_cache_eviction(self):
         con = self._connect()
         cache_size = 5
         cursor = con.cursor(prepared_statement_cache_size=cache_size)
-        cursor.execute("drop table typetest if exists")
-        try:
-            cursor.execute("create table typetest (id integer GENERATED ALWAYS AS IDENTITY, smallint_col smallint, "
-                           "integer_col integer, bigint_col bigint, numeric_col numeric(10, 2), "
-                           "decimal_col decimal(10, 2), double_col double)")
-
+        with typetest_table(con, cursor):
             test_vals = (3424, 23453464, 45453453454545, decimal.Decimal('234355.33'), decimal.Decimal('976.2'),
                          10000.999)
 
@@ -227,22 +188,11 @@ class NuoDBStatementManagementTest(NuoBase):
             for query in queries[len(queries) - cache_size:]:
                 self.assertIn(query, ps_cache)
 
-        finally:
-            try:
-                cursor.execute("drop table typetest if exists")
-            finally:
-                con.close()
-
     def test_prepared_statement_cache_eviction_lru(self):
         con = self._connect()
         cache_size = 4
         cursor = con.cursor(prepared_statement_cache_size=cache_size)
-        cursor.execute("drop table typetest if exists")
-        try:
-            cursor.execute("create table typetest (id integer GENERATED ALWAYS AS IDENTITY, smallint_col smallint, "
-                           "integer_col integer, bigint_col bigint, numeric_col numeric(10, 2), "
-                           "decimal_col decimal(10, 2), double_col double)")
-
+        with typetest_table(con, cursor):
             test_vals = (3424, 23453464, 45453453454545, decimal.Decimal('234355.33'), decimal.Decimal('976.2'),
                          10000.999)
 
@@ -269,12 +219,6 @@ class NuoDBStatementManagementTest(NuoBase):
             for query in [queries[0], queries[4]]:
                 self.assertNotIn(query, ps_cache)
 
-        finally:
-            try:
-                cursor.execute("drop table typetest if exists")
-            finally:
-                con.close()
-
 
 def extract_statement_handle(cursor):
     return cursor._statement_cache._statement.handle